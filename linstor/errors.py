@@ -2,6 +2,8 @@ class LinstorError(Exception):
     """
     Linstor basic error class with a message
     """
+    __slots__ = ('_msg', '_errors')
+
     def __init__(self, msg, more_errors=None):
         self._msg = msg
         if more_errors is None:
@@ -19,13 +21,15 @@ class LinstorError(Exception):
         return "Error: {msg}".format(msg=self._msg)
 
     def __repr__(self):
-        return "LinstorError('{msg}')".format(msg=self._msg)
+        return "LinstorError({msg!r})".format(msg=self._msg)
 
 
 class LinstorNetworkError(LinstorError):
     """
     Linstor Error indicating an network/connection error.
     """
+    __slots__ = ()
+
     def __init__(self, msg, more_errors=None):
         super(LinstorNetworkError, self).__init__(msg, more_errors)
 
@@ -34,6 +38,8 @@ class LinstorTimeoutError(LinstorError):
     """
     Linstor network timeout error
     """
+    __slots__ = ()
+
     def __init__(self, msg, more_errors=None):
         super(LinstorTimeoutError, self).__init__(msg, more_errors)
 
@@ -42,6 +48,8 @@ class LinstorApiCallError(LinstorError):
     """
     Linstor error from an apicall response.
     """
+    __slots__ = ()
+
     def __init__(self, apicallresponse, more_errors=None):
         super(LinstorApiCallError, self).__init__(str(apicallresponse), more_errors)
 
@@ -50,6 +58,8 @@ class LinstorArgumentError(LinstorError):
     """
     Linstor error if an argument for a function call is invalid.
     """
+    __slots__ = ()
+
     def __init__(self, msg, more_errors=None):
         super(LinstorArgumentError, self).__init__(msg, more_errors)
 
@@ -58,6 +68,8 @@ class LinstorReadOnlyAfterSetError(LinstorError):
     """
     Linstor error raised if a property that is only allowed to be set once, is re-set.
     """
+    __slots__ = ()
+
     def __init__(self, msg=None, more_errors=None):
         if msg is None:
             msg = 'After this property got set it is read-only'
@@ -11,7 +11,6 @@ import ssl
 import base64
 import re
 from datetime import datetime
-from distutils.version import StrictVersion
 
 from .errors import LinstorError, LinstorNetworkError, LinstorTimeoutError, LinstorApiCallError, LinstorArgumentError
 from .responses import ApiCallResponse, ErrorReport, StoragePoolListResponse, StoragePoolDriver
@@ -39,6 +38,27 @@ import linstor.sharedconsts as apiconsts
 
 API_VERSION_MIN = "1.0.4"
 API_VERSION = API_VERSION_MIN
+USER_AGENT = "PythonLinstor/{v} (API{a})".format(v=VERSION, a=API_VERSION_MIN)
+
+_SIZE_RE = re.compile(r'(\d+)(\D*)')
+_VERSION_RE = re.compile(r'^(\d+)\.(\d+)(?:\.(\d+))?')
+
+
+def _parse_version(version):
+    """
+    Parses a "major.minor[.patch]" version string into a comparable tuple.
+
+    Replaces distutils' StrictVersion, which is slow to import and deprecated.
+
+    :param str version: version string e.g. "1.0.4"
+    :return: tuple of (major, minor, patch)
+    :rtype: (int, int, int)
+    :raises ValueError: if version isn't a valid version string
+    """
+    m = _VERSION_RE.match(version)
+    if m is None:
+        raise ValueError("invalid version number '{v}'".format(v=version))
+    return int(m.group(1)), int(m.group(2)), int(m.group(3) or 0)
 
 
 logging.basicConfig(level=logging.WARNING)
@@ -138,6 +158,9 @@ class Linstor(object):
         API_SINGLE_NODE_REQ: ResourceConnection
     }
 
+    # response classes whose REST reply is a json list of entries, one object each
+    _PER_ENTRY_RESPONSES = (ApiCallResponse, ErrorReport)
+
     REST_PORT = 3370
     REST_HTTPS_PORT = 3371
 
@@ -150,6 +173,7 @@ class Linstor(object):
         self._connected = False
         self._mode_curl = False
         self._ctrl_version = None
+        self._ctrl_rest_version = None  # parsed rest_api_version of _ctrl_version
         self._username = None
         self._password = None
         self._certfile = None
@@ -158,7 +182,7 @@ class Linstor(object):
         self._allow_insecure = False
 
         self._http_headers = {
-            "User-Agent": "PythonLinstor/{v} (API{a})".format(v=VERSION, a=API_VERSION_MIN),
+            "User-Agent": USER_AGENT,
             "Connection": "keep-alive",
             "Accept-Encoding": "gzip"
         }
@@ -244,21 +268,23 @@ class Linstor(object):
     @classmethod
     def parse_volume_size_to_kib(cls, size_str):
         """
-        Parses a string e.g. "1g" to computer size units and return KiB
+        Parses a string e.g. "1g" to computer size units and return KiB.
+        An int is taken as size in KiB and returned as is.
 
-        :param str size_str: string to parse
+        :param Union[str, int] size_str: string to parse or size in KiB
         :return: KiB of the parsed string
         :rtype: int
         :raises LinstorArgumentError: If string can not be parsed as number
         """
-        m = re.match(r'(\d+)(\D*)', size_str)
+        if isinstance(size_str, int):
+            return size_str
 
-        size = 0
-        try:
-            size = int(m.group(1))
-        except AttributeError:
+        m = _SIZE_RE.match(size_str)
+        if m is None:
             raise LinstorArgumentError("Size '{s}' is not a valid number".format(s=size_str))
 
+        size = int(m.group(1))
+
         unit_str = m.group(2)
         if unit_str == "":
             unit_str = "GiB"
@@ -266,11 +292,9 @@ class Linstor(object):
             _, unit = SizeCalc.UNITS_MAP[unit_str.lower()]
         except KeyError:
             raise LinstorArgumentError(
-                '"%s" is not a valid unit!\nValid units: %s' % (unit_str, SizeCalc.UNITS_LIST_STR)
+                '"{u}" is not a valid unit!\nValid units: {v}'.format(u=unit_str, v=SizeCalc.UNITS_LIST_STR)
             )
 
-        _, unit = SizeCalc.UNITS_MAP[unit_str.lower()]
-
         if unit != SizeCalc.UNIT_KiB:
             size = SizeCalc.convert_round_up(size, unit,
                                              SizeCalc.UNIT_KiB)
@@ -291,7 +315,7 @@ class Linstor(object):
         :return: True if supported
         :raises: LinstorError if server version is lower than required version
         """
-        if self._ctrl_version and StrictVersion(self._ctrl_version.rest_api_version) < StrictVersion(required_version):
+        if self._ctrl_rest_version and self._ctrl_rest_version < _parse_version(required_version):
             raise LinstorError(
                 msg + ", REST-API-VERSION: " + self._ctrl_version.rest_api_version +
                 "; needed " + required_version
@@ -304,7 +328,7 @@ class Linstor(object):
         :return: True if server version is smaller than given version
         :rtype: bool
         """
-        return self._ctrl_version and StrictVersion(self._ctrl_version.rest_api_version) < StrictVersion(version)
+        return self._ctrl_rest_version and self._ctrl_rest_version < _parse_version(version)
 
     def _rest_request(self, apicall, method, path, body=None, reconnect=True):
         """
@@ -321,8 +345,7 @@ class Linstor(object):
             return []
 
         try:
-            headers = {}
-            headers.update(self._http_headers)
+            headers = dict(self._http_headers)
             if self.username:
                 auth_token = self.username + ":" + self.password
                 headers["Authorization"] = "Basic " + base64.b64encode(auth_token.encode()).decode()
@@ -380,7 +403,7 @@ class Linstor(object):
 
         response_list = []
         response_class = self.APICALL2RESPONSE.get(apicall, ApiCallResponse)
-        if response_class in [ApiCallResponse, ErrorReport]:
+        if response_class in self._PER_ENTRY_RESPONSES:
             response_list = [response_class(x) for x in data]
         else:
             if "ret_code" in data:
@@ -449,6 +472,23 @@ class Linstor(object):
         """
         return [reply for reply in replies if reply.is_error()]
 
+    @classmethod
+    def _list_response_or_raise(cls, list_res, response_class):
+        """
+        Returns the list response object from the replies of a list request.
+
+        :param list[RESTMessageResponse] list_res: replies of the list request
+        :param type response_class: Expected list response class
+        :return: The first reply, if it is a response_class object
+        :raises LinstorError: if no data received.
+        :raises LinstorApiCallError: on an apicall error from controller
+        """
+        if list_res:
+            if isinstance(list_res[0], response_class):
+                return list_res[0]
+            raise LinstorApiCallError(list_res[0])
+        raise LinstorError("No list response received.")
+
     @classmethod
     def return_if_failure(cls, replies_):
         """
@@ -474,16 +514,22 @@ class Linstor(object):
         return None
 
     @classmethod
-    def _modify_props(cls, msg, property_dict, delete_props=None):
+    def _modify_props(cls, body, property_dict, delete_props=None):
+        """
+        Adds the property changes to a REST modify request body.
+
+        :param dict[str, Any] body: request body to update
+        :param Optional[dict[str, str]] property_dict: Dict containing key, value pairs for new values.
+        :param Optional[list[str]] delete_props: List of properties to delete
+        :return: the updated body
+        :rtype: dict[str, Any]
+        """
         if property_dict:
-            for key, val in property_dict.items():
-                lin_kv = msg.override_props.add()
-                lin_kv.key = key
-                lin_kv.value = val
+            body["override_props"] = property_dict
 
         if delete_props:
-            msg.delete_prop_keys.extend(delete_props)
-        return msg
+            body["delete_props"] = delete_props
+        return body
 
     @classmethod
     def has_linstor_https(cls, hostname, port):
@@ -507,6 +553,27 @@ class Linstor(object):
             return 0
         return 0
 
+    @classmethod
+    def _new_ssl_context(cls):
+        """
+        Creates a TLS client context that doesn't verify the server, restricted to TLS 1.2 or newer.
+
+        :return: SSLContext for the REST connection
+        :rtype: ssl.SSLContext
+        """
+        if hasattr(ssl, 'PROTOCOL_TLS_CLIENT'):
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        else:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS if hasattr(ssl, 'PROTOCOL_TLS') else 2)
+
+        if hasattr(ssl, 'TLSVersion'):
+            context.minimum_version = ssl.TLSVersion.TLSv1_2
+        else:
+            context.options |= ssl.OP_NO_SSLv2 | ssl.OP_NO_SSLv3 | ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1
+        return context
+
     def connect(self):
         """
         Connects the internal linstor network client.
@@ -531,7 +598,7 @@ class Linstor(object):
                 port = https_port
 
         if is_https:
-            context = ssl.SSLContext(ssl.PROTOCOL_TLS if hasattr(ssl, 'PROTOCOL_TLS') else 2)
+            context = self._new_ssl_context()
             if self._certfile or self._keyfile:
                 context.load_cert_chain(self._certfile, self._keyfile)
             if self._cafile:
@@ -552,14 +619,21 @@ class Linstor(object):
 
         try:
             self._rest_conn.connect()
+            # small request/response round trips, older http.client versions leave Nagle enabled
+            try:
+                self._rest_conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except socket.error:
+                pass
+            self._ctrl_rest_version = None
             self._ctrl_version = self.controller_version()
             if not self._ctrl_version.rest_api_version.startswith("1") or \
-                    StrictVersion(API_VERSION_MIN) > StrictVersion(self._ctrl_version.rest_api_version):
+                    _parse_version(API_VERSION_MIN) > _parse_version(self._ctrl_version.rest_api_version):
                 self._rest_conn.close()
                 raise LinstorApiCallError(
                     "Client doesn't support Controller rest api version: " + self._ctrl_version.rest_api_version +
                     "; Minimal version needed: " + API_VERSION_MIN
                 )
+            self._ctrl_rest_version = _parse_version(self._ctrl_version.rest_api_version)
             self._connected = True
         except socket.error as err:
             hosturl = self._ctrl_host
@@ -606,7 +680,7 @@ class Linstor(object):
         :return:
         """
         # is_active is added with API 1.0.7, before active stlt conn was set via property
-        if self._ctrl_version and StrictVersion(self._ctrl_version.rest_api_version) >= StrictVersion("1.0.7"):
+        if self._ctrl_rest_version and self._ctrl_rest_version >= _parse_version("1.0.7"):
             net_interface["is_active"] = value
 
     def node_create(
@@ -684,11 +758,7 @@ class Linstor(object):
         if node_type is not None:
             body["node_type"] = node_type
 
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         return self._rest_request(apiconsts.API_MOD_NODE, "PUT", "/v1/nodes/" + node_name, body)
 
@@ -846,11 +916,7 @@ class Linstor(object):
         :raises LinstorApiCallError: on an apicall error from controller
         """
         list_res = self.node_list(filter_by_nodes=filter_by_nodes, filter_by_props=filter_by_props)
-        if list_res:
-            if isinstance(list_res[0], NodeListResponse):
-                return list_res[0]
-            raise LinstorApiCallError(list_res[0])
-        raise LinstorError("No list response received.")
+        return self._list_response_or_raise(list_res, NodeListResponse)
 
     def node_types(self):
         """
@@ -890,11 +956,7 @@ class Linstor(object):
         :rtype: list[ApiCallResponse]
         """
         body = {}
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         return self._rest_request(
             apiconsts.API_MOD_STOR_POOL_DFN,
@@ -990,7 +1052,7 @@ class Linstor(object):
         :return: A list containing ApiCallResponses from the controller.
         :rtype: list[ApiCallResponse]
         """
-        if storage_driver not in StoragePoolDriver.list():
+        if not StoragePoolDriver.is_known(storage_driver):
             raise LinstorError("Unknown storage driver: " + storage_driver)
 
         body = {
@@ -1027,11 +1089,7 @@ class Linstor(object):
         """
         body = {}
 
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         return self._rest_request(
             apiconsts.API_MOD_STOR_POOL,
@@ -1106,11 +1164,7 @@ class Linstor(object):
             filter_by_nodes=filter_by_nodes,
             filter_by_stor_pools=filter_by_stor_pools,
             filter_by_props=filter_by_props)
-        if list_res:
-            if isinstance(list_res[0], StoragePoolListResponse):
-                return list_res[0]
-            raise LinstorApiCallError(list_res[0])
-        raise LinstorError("No list response received.")
+        return self._list_response_or_raise(list_res, StoragePoolListResponse)
 
     @classmethod
     def layer_list(cls):
@@ -1254,11 +1308,7 @@ class Linstor(object):
             provider_list=provider_list
         )
 
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         return self._rest_request(
             apiconsts.API_MOD_RSC_GRP,
@@ -1302,11 +1352,7 @@ class Linstor(object):
 
         list_res = self._rest_request(apiconsts.API_LST_RSC_GRP, "GET", path)
 
-        if list_res:
-            if isinstance(list_res[0], ResourceGroupResponse):
-                return list_res[0]
-            raise LinstorApiCallError(list_res[0])
-        raise LinstorError("No list response received.")
+        return self._list_response_or_raise(list_res, ResourceGroupResponse)
 
     def resource_group_spawn(
             self,
@@ -1431,11 +1477,7 @@ class Linstor(object):
         self._require_version("1.0.8", msg="Resource group API not supported by server")
         body = {}
 
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         if gross is not None:
             self._require_version("1.0.13", msg="Modify volume-group with gross size not supported.")
@@ -1480,11 +1522,7 @@ class Linstor(object):
             "/v1/resource-groups/" + resource_grp_name + "/volume-groups"
         )
 
-        if list_res:
-            if isinstance(list_res[0], VolumeGroupResponse):
-                return list_res[0]
-            raise LinstorApiCallError(list_res[0])
-        raise LinstorError("No list response received.")
+        return self._list_response_or_raise(list_res, VolumeGroupResponse)
 
     def resource_dfn_create(self, name, port=None, external_name=None, layer_list=None, resource_group=None):
         """
@@ -1539,11 +1577,7 @@ class Linstor(object):
         if peer_slots is not None:
             body["drbd_peer_slots"] = peer_slots
 
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         return self._rest_request(
             apiconsts.API_MOD_RSC_DFN,
@@ -1632,11 +1666,7 @@ class Linstor(object):
             filter_by_resource_definitions=filter_by_resource_definitions,
             filter_by_props=filter_by_props
         )
-        if list_res:
-            if isinstance(list_res[0], ResourceDefinitionResponse):
-                return list_res[0]
-            raise LinstorApiCallError(list_res[0])
-        raise LinstorError("No list response received.")
+        return self._list_response_or_raise(list_res, ResourceDefinitionResponse)
 
     def resource_dfn_props_list(self, rsc_name, filter_by_namespace=''):
         """
@@ -1647,7 +1677,10 @@ class Linstor(object):
         :return: dict containing matching keys
         :raises LinstorError: if resource can not be found
         """
-        rsc_dfn_list_replies = self.resource_dfn_list([rsc_name])
+        rsc_dfn_list_replies = self.resource_dfn_list(
+            query_volume_definitions=False,
+            filter_by_resource_definitions=[rsc_name]
+        )
         if not rsc_dfn_list_replies or not rsc_dfn_list_replies[0]:
             raise LinstorError('Could not list resource definitions, or they are empty')
 
@@ -1733,11 +1766,7 @@ class Linstor(object):
         if size:
             body["size_kib"] = size
 
-        if set_properties:
-            body["override_props"] = set_properties
-
-        if delete_properties:
-            body["delete_props"] = delete_properties
+        self._modify_props(body, set_properties, delete_properties)
 
         if gross is not None:
             self._require_version("1.0.13", msg="Modify volume-definition with gross size not supported.")
@@ -2000,11 +2029,7 @@ class Linstor(object):
         """
         body = {}
 
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         return self._rest_request(
             apiconsts.API_MOD_RSC,
@@ -2155,11 +2180,7 @@ class Linstor(object):
             filter_by_stor_pools=filter_by_stor_pools,
             filter_by_resources=filter_by_resources,
             filter_by_props=filter_by_props)
-        if list_res:
-            if isinstance(list_res[0], ResourceResponse):
-                return list_res[0]
-            raise LinstorApiCallError(list_res[0])
-        raise LinstorError("No list response received.")
+        return self._list_response_or_raise(list_res, ResourceResponse)
 
     def volume_modify(self, node_name, rsc_name, vlm_nr, property_dict, delete_props=None):
         """
@@ -2177,11 +2198,7 @@ class Linstor(object):
 
         body = {}
 
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         return self._rest_request(
             apiconsts.API_MOD_VLM,
@@ -2384,11 +2401,7 @@ class Linstor(object):
         :rtype: list[ApiCallResponse]
         """
         body = {}
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         return self._rest_request(
             apiconsts.API_MOD_RSC_CONN,
@@ -2421,11 +2434,7 @@ class Linstor(object):
         :raises LinstorApiCallError: on an apicall error from controller
         """
         list_res = self.resource_conn_list(rsc_name)
-        if list_res:
-            if isinstance(list_res[0], ResourceConnectionsResponse):
-                return list_res[0]
-            raise LinstorApiCallError(list_res[0])
-        raise LinstorError("No list response received.")
+        return self._list_response_or_raise(list_res, ResourceConnectionsResponse)
 
     def resource_conn_node_list_raise(self, rsc_name, node_a, node_b):
         """
@@ -2442,11 +2451,7 @@ class Linstor(object):
             "GET",
             "/v1/resource-definitions/" + rsc_name + "/resource-connections/" + node_a + "/" + node_b
         )
-        if list_res:
-            if isinstance(list_res[0], ResourceConnection):
-                return list_res[0]
-            raise LinstorApiCallError(list_res[0])
-        raise LinstorError("No list response received.")
+        return self._list_response_or_raise(list_res, ResourceConnection)
 
     def drbd_proxy_enable(self, rsc_name, node_a, node_b, port=None):
         """
@@ -2507,11 +2512,7 @@ class Linstor(object):
         """
         body = {}
 
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         if compression_type:
             body["compression_type"] = compression_type
@@ -2635,10 +2636,13 @@ class Linstor(object):
         :rtype: list[SnapshotsResponse]
         """
         if self.api_version_smaller("1.1.0"):
-            rsc_dfns = self.resource_dfn_list()[0]
+            rsc_dfns = self.resource_dfn_list(query_volume_definitions=False)[0]
+            filter_rscs = {x.lower() for x in filter_by_resources} if filter_by_resources else None
 
             result = []
             for rsc_dfn in rsc_dfns.resource_definitions:
+                if filter_rscs is not None and rsc_dfn.name.lower() not in filter_rscs:
+                    continue
                 snapshots = self._rest_request(
                     apiconsts.API_LST_SNAPSHOT_DFN,
                     "GET", "/v1/resource-definitions/" + rsc_dfn.name + "/snapshots"
@@ -2671,11 +2675,7 @@ class Linstor(object):
         :raises LinstorApiCallError: on an apicall error from controller
         """
         list_res = self.snapshot_dfn_list(filter_by_nodes=filter_by_nodes, filter_by_resources=filter_by_resources)
-        if list_res:
-            if isinstance(list_res[0], SnapshotResponse):
-                return list_res[0]
-            raise LinstorApiCallError(list_res[0])
-        raise LinstorError("No list response received.")
+        return self._list_response_or_raise(list_res, SnapshotResponse)
 
     def error_report_list(self, nodes=None, with_content=False, since=None, to=None, ids=None):
         """
@@ -2734,11 +2734,7 @@ class Linstor(object):
         :rtype: list[ApiCallResponse]
         """
         body = {}
-        if property_dict:
-            body["override_props"] = property_dict
-
-        if delete_props:
-            body["delete_props"] = delete_props
+        self._modify_props(body, property_dict, delete_props)
 
         return self._rest_request(
             apiconsts.API_MOD_KVS,
@@ -2759,11 +2755,7 @@ class Linstor(object):
             "GET", "/v1/key-value-store"
         )
 
-        if list_res:
-            if isinstance(list_res[0], KeyValueStoresResponse):
-                return list_res[0]
-            raise LinstorApiCallError(list_res[0])
-        raise LinstorError("No list response received.")
+        return self._list_response_or_raise(list_res, KeyValueStoresResponse)
 
     def keyvaluestore_list(self, instance_name):
         """
@@ -2894,13 +2886,20 @@ class MultiLinstor(Linstor):
     def controller_uri_list(cls, controller_list):
         """
         Converts a simple '10.0.0.1,10.0.0.2' ip/host list to ['linstor://10.0.0.1', 'linstor://10.0.0.2'] uris.
-        :param str controller_list: list of controller addresses separated by comma
+        An already split list of addresses is converted the same way.
+
+        :param Union[str, list[str]] controller_list: list of controller addresses separated by comma
         :return: List of linstor uris
         :rtype: list[str]
         """
+        if isinstance(controller_list, list):
+            host_list = controller_list
+        else:
+            host_list = controller_list.split(',')
+
         servers = []
         # add linstor uri scheme
-        for hp in controller_list.split(','):
+        for hp in host_list:
             if hp:
                 if '://' in hp:
                     servers.append(hp)
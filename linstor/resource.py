@@ -337,19 +337,22 @@ class Resource(object):
                 self.defined = True
                 for vlm_dfn in rsc_dfn.volume_definitions:
                     vlm_nr = vlm_dfn.number
-                    if not self.volumes.get(vlm_nr):
-                        self.volumes[vlm_nr] = Volume(None)
-                    self.volumes[vlm_nr]._volume_id = vlm_nr
-                    self.volumes[vlm_nr]._rsc_name = self._linstor_name
-                    self.volumes[vlm_nr]._client_ref = self.client
-                    size_b = linstor.SizeCalc.convert_round_up(vlm_dfn.size, linstor.SizeCalc.UNIT_KiB,
-                                                               linstor.SizeCalc.UNIT_B)
-                    self.volumes[vlm_nr]._size = size_b
-                    if vlm_dfn.drbd_data is not None:
-                        self.volumes[vlm_nr]._minor = vlm_dfn.drbd_data.minor
+                    volume = self.volumes.get(vlm_nr)
+                    if not volume:
+                        volume = Volume(None)
+                        self.volumes[vlm_nr] = volume
+                    volume._volume_id = vlm_nr
+                    volume._rsc_name = self._linstor_name
+                    volume._client_ref = self.client
+                    volume._size = linstor.SizeCalc.convert_round_up(vlm_dfn.size, linstor.SizeCalc.UNIT_KiB,
+                                                                     linstor.SizeCalc.UNIT_B)
+                    drbd_data = vlm_dfn.drbd_data
+                    if drbd_data is not None:
+                        volume._minor = drbd_data.minor
                 for key, value in rsc_dfn.properties.items():
                     if key == 'DrbdOptions/Net/allow-two-primaries':
                         self._allow_two_primaries = True if value == 'yes' else False
+                break
 
         if self._linstor_name is None:
             return True
@@ -366,13 +369,17 @@ class Resource(object):
             node_name = rsc.node_name
             self._assignments[node_name] = is_diskless
             for vlm in rsc.volumes:
-                vlm_nr = vlm.number
-                if vlm.device_path:
-                    self.volumes[vlm_nr]._device_path = vlm.device_path
-                if vlm.storage_pool_name and not is_diskless:
-                    self.volumes[vlm_nr]._storage_pool_name = vlm.storage_pool_name
-                if vlm.drbd_data is not None:
-                    self.volumes[vlm_nr]._minor = vlm.drbd_data.drbd_volume_definition.minor
+                volume = self.volumes[vlm.number]
+                device_path = vlm.device_path
+                if device_path:
+                    volume._device_path = device_path
+                if not is_diskless:
+                    storage_pool_name = vlm.storage_pool_name
+                    if storage_pool_name:
+                        volume._storage_pool_name = storage_pool_name
+                drbd_data = vlm.drbd_data
+                if drbd_data is not None:
+                    volume._minor = drbd_data.drbd_volume_definition.minor
 
         return True
 
@@ -661,7 +668,7 @@ class Resource(object):
                     )
                 )
 
-        return Resource(resource_name_to, ",".join(self.client.uri_list))
+        return Resource(resource_name_to, self.client.uri_list)
 
     def diskless(self, node_name):
         """
@@ -788,7 +795,9 @@ class Resource(object):
             self._lin = lin
 
             if snapshots and node_name is None:  # only remove snapshots if resource definition will be deleted
-                snapshot_list = lin.snapshot_dfn_list()[0]  # type: linstor.responses.SnapshotResponse
+                snapshot_list = lin.snapshot_dfn_list(
+                    filter_by_resources=[self._linstor_name]
+                )[0]  # type: linstor.responses.SnapshotResponse
                 for snap in [x for x in snapshot_list.snapshots if x.rsc_name.lower() == self._linstor_name.lower()]:
                     lin.snapshot_delete(rsc_name=self._linstor_name, snapshot_name=snap.snapshot_name)
 
@@ -335,10 +335,8 @@ class NodeListResponse(RESTMessageResponse):
         :return: Node object of the node, or None
         :rtype: Node
         """
-        for n in self.nodes:
-            if n.name == node_name:
-                return n
-        return None
+        node_data = next((x for x in self._rest_data if x["name"] == node_name), None)
+        return Node(node_data) if node_data is not None else None
 
     @property
     def data_v0(self):
@@ -382,19 +380,33 @@ class StoragePoolDriver(object):
     SPDK = "SPDK"
     OPENFLEX_TARGET = "OPENFLEX_TARGET"
 
+    _DRIVERS = (
+        LVM,
+        LVMThin,
+        ZFS,
+        ZFSThin,
+        Diskless,
+        FILE,
+        FILEThin,
+        SPDK,
+        OPENFLEX_TARGET
+    )
+    _DRIVER_SET = frozenset(_DRIVERS)
+
     @staticmethod
     def list():
-        return [
-            StoragePoolDriver.LVM,
-            StoragePoolDriver.LVMThin,
-            StoragePoolDriver.ZFS,
-            StoragePoolDriver.ZFSThin,
-            StoragePoolDriver.Diskless,
-            StoragePoolDriver.FILE,
-            StoragePoolDriver.FILEThin,
-            StoragePoolDriver.SPDK,
-            StoragePoolDriver.OPENFLEX_TARGET
-        ]
+        return list(StoragePoolDriver._DRIVERS)
+
+    @staticmethod
+    def is_known(storage_driver):
+        """
+        Checks if the given storage driver name is a known driver.
+
+        :param str storage_driver: Storage driver name
+        :return: True if it is one of the drivers returned by list()
+        :rtype: bool
+        """
+        return storage_driver in StoragePoolDriver._DRIVER_SET
 
     @classmethod
     def diskless_driver(cls):
@@ -654,8 +666,7 @@ class KeyValueStoresResponse(RESTMessageResponse):
         :return: KeyValueStore object of the instance, if none found an empty is created
         :rtype: KeyValueStore
         """
-        kv = [x for x in self._rest_data if x['name'] == name]
-        kv = kv[0] if kv else {}
+        kv = next((x for x in self._rest_data if x['name'] == name), {})
         return KeyValueStore(name, kv.get('props', {}))
 
 
@@ -763,11 +774,13 @@ class VolumeDefinition(RESTMessageResponse):
             "vlm_dfn_uuid": self.uuid
         }
 
-        if self.flags:
-            v0_vlm_dfn['vlm_flags'] = self.flags
+        flags = self.flags
+        if flags:
+            v0_vlm_dfn['vlm_flags'] = flags
 
-        if self.properties:
-            v0_vlm_dfn['vlm_props'] = [{"key": x, "value": v} for x, v in self.properties.items()]
+        props = self.properties
+        if props:
+            v0_vlm_dfn['vlm_props'] = [{"key": x, "value": v} for x, v in props.items()]
 
         drbd_data = self.drbd_data
         if drbd_data:
@@ -903,29 +916,38 @@ class ResourceDefinitionResponse(RESTMessageResponse):
 
         :return: Dictionary with old resource definition format
         """
-        rsc_dfns = []
-        for rsc_dfn in self.resource_definitions:
-            v0_rsc_dfn = {
-                "rsc_name": rsc_dfn.name,
-                "rsc_dfn_uuid": rsc_dfn.uuid,
-                "vlm_dfns": [x.data_v0 for x in rsc_dfn.volume_definitions]
-            }
-
-            if rsc_dfn.flags:
-                v0_rsc_dfn['rsc_dfn_flags'] = rsc_dfn.flags
-            if rsc_dfn.properties:
-                v0_rsc_dfn["rsc_dfn_props"] = [{"key": x, "value": v} for x, v in rsc_dfn.properties.items()]
+        return {
+            "rsc_dfns": [self._rsc_dfn_data_v0(rsc_dfn) for rsc_dfn in self.resource_definitions]
+        }
 
-            drbd_data = rsc_dfn.drbd_data
-            if drbd_data:
-                v0_rsc_dfn['rsc_dfn_port'] = drbd_data.port
-                v0_rsc_dfn['rsc_dfn_secret'] = drbd_data.secret
+    @staticmethod
+    def _rsc_dfn_data_v0(rsc_dfn):
+        """
+        Builds the compatibility output for a single resource definition.
 
-            rsc_dfns.append(v0_rsc_dfn)
-        return {
-            "rsc_dfns": rsc_dfns
+        :param ResourceDefinition rsc_dfn: resource definition to convert
+        :return: Dictionary with old resource definition format
+        """
+        v0_rsc_dfn = {
+            "rsc_name": rsc_dfn.name,
+            "rsc_dfn_uuid": rsc_dfn.uuid,
+            "vlm_dfns": [x.data_v0 for x in rsc_dfn.volume_definitions]
         }
 
+        flags = rsc_dfn.flags
+        if flags:
+            v0_rsc_dfn['rsc_dfn_flags'] = flags
+        props = rsc_dfn.properties
+        if props:
+            v0_rsc_dfn["rsc_dfn_props"] = [{"key": x, "value": v} for x, v in props.items()]
+
+        drbd_data = rsc_dfn.drbd_data
+        if drbd_data:
+            v0_rsc_dfn['rsc_dfn_port'] = drbd_data.port
+            v0_rsc_dfn['rsc_dfn_secret'] = drbd_data.secret
+
+        return v0_rsc_dfn
+
 
 class SelectFilter(RESTMessageResponse):
     def __init__(self, rest_data):
@@ -3,6 +3,8 @@ import re
 from .errors import LinstorError
 from collections import OrderedDict
 
+_SIZE_UNIT_RE = re.compile(r'(\d+)\s*(\D*)')
+
 
 class SizeCalc(object):
 
@@ -57,6 +59,8 @@ class SizeCalc(object):
 
     UNITS_LIST_STR = ', '.join([unit_str for unit_str, _ in UNITS_MAP.values()])
 
+    _APPROXIMATE_UNITS = ("KiB", "MiB", "GiB", "TiB", "PiB")
+
     @classmethod
     def parse_unit(cls, value):
         """
@@ -67,7 +71,7 @@ class SizeCalc(object):
         :return: a tuple of the size value as int and the SizeCalc.UNIT
         :rtype: (int, int)
         """
-        m = re.match(r'(\d+)\s*(\D*)', value)
+        m = _SIZE_UNIT_RE.match(value)
 
         size = None
         if m:
@@ -82,7 +86,9 @@ class SizeCalc(object):
         try:
             _, unit = SizeCalc.UNITS_MAP[unit_str.lower()]
         except KeyError:
-            raise LinstorError('"%s" is not a valid unit!\n' % unit_str)
+            raise LinstorError(
+                '"{u}" is not a valid unit!\nValid units: {v}'.format(u=unit_str, v=SizeCalc.UNITS_LIST_STR)
+            )
 
         return size, unit
 
@@ -158,13 +164,7 @@ class SizeCalc(object):
         :return: human readable size string
         :rtype: str
         """
-        units = [
-            "KiB",
-            "MiB",
-            "GiB",
-            "TiB",
-            "PiB"
-        ]
+        units = cls._APPROXIMATE_UNITS
         max_index = len(units)
 
         index = 0
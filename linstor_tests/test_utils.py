@@ -1,5 +1,6 @@
 import unittest
-from linstor import SizeCalc, LinstorError
+from linstor import SizeCalc, LinstorError, LinstorArgumentError, Linstor
+from linstor.linstorapi import _parse_version
 
 
 class TestUtils(unittest.TestCase):
@@ -23,3 +24,20 @@ class TestUtils(unittest.TestCase):
 
         self.assertEqual(3221225472, SizeCalc.auto_convert("3Gib", SizeCalc.UNIT_B))
         self.assertEqual(3145728, SizeCalc.auto_convert("3Gib", SizeCalc.UNIT_KiB))
+
+    def test_parse_volume_size_to_kib(self):
+        self.assertEqual(1048576, Linstor.parse_volume_size_to_kib("1"))
+        self.assertEqual(1048576, Linstor.parse_volume_size_to_kib("1g"))
+        self.assertEqual(10240, Linstor.parse_volume_size_to_kib("10MiB"))
+        self.assertEqual(97657, Linstor.parse_volume_size_to_kib("100MB"))
+        self.assertEqual(4096, Linstor.parse_volume_size_to_kib(4096))
+
+        self.assertRaises(LinstorArgumentError, Linstor.parse_volume_size_to_kib, "nosize")
+        self.assertRaises(LinstorArgumentError, Linstor.parse_volume_size_to_kib, "10XB")
+
+    def test_parse_version(self):
+        self.assertEqual((1, 0, 4), _parse_version("1.0.4"))
+        self.assertEqual((1, 2, 0), _parse_version("1.2"))
+        self.assertTrue(_parse_version("1.0.10") > _parse_version("1.0.9"))
+
+        self.assertRaises(ValueError, _parse_version, "one.two")